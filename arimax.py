@@ -12,19 +12,182 @@ baseline for many forecasting pipelines in the energy domain.
 Some studies highlight that exogenous indicators such as
 temperature and calendar effects can improve forecasting accuracy
 when included in ARIMA models【929455163347937†L28-L36】. This module provides
-lightweight wrappers around ``statsmodels``' ARIMA implementation.
+lightweight wrappers around the ARIMA implementations exposed by
+:mod:`backends` (``statsforecast`` when installed, ``statsmodels``
+otherwise). The default ARIMAX(1, 0, 1) specification is instead
+estimated with a Numba-compiled conditional likelihood when ``numba``
+and ``scipy`` are available.
 """
 
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+from .backends import ModelBackend, _all_finite, _fit_arima_backend, forecast_index
+
 try:
-    from statsmodels.tsa.arima.model import ARIMA
+    from numba import njit, prange
 except ImportError:
-    ARIMA = None  # type: ignore
+    njit = None  # type: ignore
+
+try:
+    from scipy.linalg import lstsq
+    from scipy.optimize import minimize
+except ImportError:
+    lstsq = None  # type: ignore
+    minimize = None  # type: ignore
+
+
+def _ols(X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Least-squares coefficients of ``y`` on the columns of ``X``.
+
+    Solved with LAPACK's ``gelsd`` driver, which works on the thin
+    ``N x k`` problem and never forms the ``N x N`` singular vectors of
+    the tall exogenous matrix.
+    """
+    if lstsq is not None:
+        return lstsq(X, y, lapack_driver="gelsd")[0]
+    return np.linalg.lstsq(X, y, rcond=None)[0]
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _loglik_arma11(params: np.ndarray, y: np.ndarray, x: np.ndarray) -> float:
+        # Regression with ARMA(1, 1) errors, params = (c, phi, theta, beta...):
+        # u_t = y_t - c - x_t @ beta,  e_t = u_t - phi * u_{t-1} - theta * e_{t-1},
+        # conditional on the first observation with sigma^2 concentrated out.
+        c, phi, theta = params[0], params[1], params[2]
+        beta = params[3:]
+        u_prev = y[0] - c - x[0] @ beta
+        e_prev = 0.0
+        sse = 0.0
+        for t in range(1, len(y)):
+            u = y[t] - c - x[t] @ beta
+            e = u - phi * u_prev - theta * e_prev
+            sse += e * e
+            u_prev = u
+            e_prev = e
+        n = len(y) - 1
+        return -0.5 * n * (np.log(2.0 * np.pi * sse / n) + 1.0)
+
+    @njit(cache=True, fastmath=True)
+    def _arma11_resid(params: np.ndarray, y: np.ndarray, x: np.ndarray) -> np.ndarray:
+        # Innovations e_t of _loglik_arma11, with e_0 = 0
+        c, phi, theta = params[0], params[1], params[2]
+        beta = params[3:]
+        resid = np.zeros(len(y))
+        u_prev = y[0] - c - x[0] @ beta
+        for t in range(1, len(y)):
+            u = y[t] - c - x[t] @ beta
+            resid[t] = u - phi * u_prev - theta * resid[t - 1]
+            u_prev = u
+        return resid
+
+
+class NumbaArma11:
+    """ARIMAX(1, 0, 1) backend using a Numba-compiled likelihood.
+
+    Parameters are estimated by conditional sum of squares: the
+    likelihood in :func:`_loglik_arma11` is maximised with L-BFGS-B,
+    starting from least-squares estimates of the regression part.
+    :meth:`fit` raises ``RuntimeError`` if the optimisation does not
+    converge. The data must be finite.
+    """
+
+    order = (1, 0, 1)
+
+    def __init__(self) -> None:
+        self.params: Optional[np.ndarray] = None
+        self._resid: Optional[np.ndarray] = None
+        self._index: Optional[pd.Index] = None
+        self._last_u = 0.0
+
+    def fit(self, series: pd.Series, exog: Optional[pd.DataFrame] = None) -> "NumbaArma11":
+        y = series.to_numpy(dtype=np.float64)
+        x = np.zeros((len(y), 0)) if exog is None else np.ascontiguousarray(exog, dtype=np.float64)
+        ols = _ols(np.column_stack([np.ones(len(y)), x]), y)
+        start = np.concatenate([ols[:1], [0.0, 0.0], ols[1:]])
+        bounds = [(None, None), (-0.999, 0.999), (-0.999, 0.999)] + [(None, None)] * x.shape[1]
+        opt = minimize(lambda p: -_loglik_arma11(p, y, x), start, method="L-BFGS-B", bounds=bounds)
+        if not opt.success:
+            raise RuntimeError(f"ARIMAX(1, 0, 1) optimisation failed: {opt.message}")
+        self.params = opt.x
+        return self._filter(series, exog)
+
+    def apply(self, series: pd.Series, exog: Optional[pd.DataFrame] = None) -> "NumbaArma11":
+        applied = NumbaArma11()
+        applied.params = self.params
+        return applied._filter(series, exog)
+
+    def _filter(self, series: pd.Series, exog: Optional[pd.DataFrame]) -> "NumbaArma11":
+        # Compute residuals and forecast state for the current parameters
+        y = series.to_numpy(dtype=np.float64)
+        x = np.zeros((len(y), 0)) if exog is None else np.ascontiguousarray(exog, dtype=np.float64)
+        self._resid = _arma11_resid(self.params, y, x)
+        self._index = series.index
+        self._last_u = y[-1] - self.params[0] - x[-1] @ self.params[3:]
+        return self
+
+    def predict(self, steps: int, exog_future: Optional[pd.DataFrame] = None) -> pd.Series:
+        c, phi, theta = self.params[:3]
+        u = np.empty(steps)
+        u[0] = phi * self._last_u + theta * self._resid[-1]
+        for h in range(1, steps):
+            u[h] = phi * u[h - 1]
+        mean = c + u
+        if exog_future is not None:
+            mean += np.asarray(exog_future, dtype=np.float64) @ self.params[3:]
+        return pd.Series(mean, index=forecast_index(self._index, steps), name="predicted_mean")
+
+    @property
+    def resid(self) -> pd.Series:
+        return pd.Series(self._resid, index=self._index)
+
+
+def _fit_mean_model(
+    series: pd.Series,
+    exog: Optional[pd.DataFrame],
+    order: Tuple[int, int, int],
+) -> Optional[ModelBackend]:
+    """Fit the ARIMAX mean equation, using the compiled path for (1, 0, 1).
+
+    Data with missing values, and fits whose compiled optimisation does
+    not converge, go to :func:`_fit_arima_backend` instead.
+    """
+    if order == NumbaArma11.order and njit is not None and minimize is not None and _all_finite(series, exog):
+        try:
+            return NumbaArma11().fit(series, exog)
+        except RuntimeError:
+            fallback = _fit_arima_backend(series, exog, order)
+            if fallback is None:
+                raise
+            return fallback
+    return _fit_arima_backend(series, exog, order)
+
+
+def _exog_future(
+    series: pd.Series,
+    exog: Optional[pd.DataFrame],
+    forecast_steps: int,
+) -> Optional[np.ndarray]:
+    """Validate ``exog`` and return its last ``forecast_steps`` rows as an array.
+
+    These rows are used as the future values of the regressors.
+    Raises ``ValueError`` if ``exog`` is shorter than the horizon or not
+    aligned with ``series``, before any model is fitted.
+    """
+    if exog is None:
+        return None
+    if exog.shape[0] < forecast_steps:
+        raise ValueError(
+            f"exog has {exog.shape[0]} rows but {forecast_steps} are needed for the forecast horizon"
+        )
+    if not series.index.equals(exog.index):
+        raise ValueError("exog must have the same index as series")
+    return exog.iloc[-forecast_steps:].to_numpy()
 
 
 def fit_arimax(
@@ -32,7 +195,8 @@ def fit_arimax(
     exog: Optional[pd.DataFrame] = None,
     order: Tuple[int, int, int] = (1, 0, 1),
     forecast_steps: int = 24,
-) -> pd.Series:
+    return_model: bool = False,
+) -> Union[pd.Series, Tuple[pd.Series, Optional[ModelBackend]]]:
     """Fit an ARIMAX model and return point forecasts.
 
     Parameters
@@ -45,17 +209,211 @@ def fit_arimax(
         The ARIMA order. Defaults to (1, 0, 1).
     forecast_steps : int
         Number of steps to forecast ahead. Defaults to 24.
+    return_model : bool
+        If True, also return the fitted model so that callers (e.g. the
+        GARCH step) can reuse its residuals instead of refitting.
+        Defaults to False.
 
     Returns
     -------
-    pd.Series
-        Predicted mean values for the specified forecast horizon. If
-        statsmodels is not available, returns a Series of NaNs.
+    pd.Series or tuple of (pd.Series, ModelBackend)
+        Predicted mean values for the specified forecast horizon,
+        followed by the fitted model if ``return_model`` is True. If
+        neither statsforecast nor statsmodels is available, the
+        forecasts are NaN and the model is ``None``.
+
+    Raises
+    ------
+    ValueError
+        If ``exog`` has fewer than ``forecast_steps`` rows or its index
+        differs from that of ``series``.
+
+    Notes
+    -----
+    Series with missing values (e.g. cells coerced to NaN by
+    :func:`data_ingestion.load_price_data`) are fitted with the
+    ``statsmodels`` backend, whose Kalman filter skips the gaps.
+    """
+    exog_future = _exog_future(series, exog, forecast_steps)
+    fitted = _fit_mean_model(series, exog, order)
+    if fitted is None:
+        forecast = pd.Series([float('nan')] * forecast_steps)
+    else:
+        forecast = fitted.predict(forecast_steps, exog_future)
+
+    if return_model:
+        return forecast, fitted
+    return forecast
+
+
+def _pacf_to_coefs(pacf: np.ndarray) -> np.ndarray:
+    """Map partial autocorrelations to stationary AR coefficients.
+
+    Applies the Durbin–Levinson recursion to a batch of candidates at
+    once: each row of ``pacf`` (shape ``(B, k)``, entries in (-1, 1))
+    becomes the coefficients of a stationary AR(k) polynomial, so no
+    rejection step is needed to enforce stationarity.
+    """
+    coefs = np.zeros_like(pacf)
+    for k in range(pacf.shape[1]):
+        prev = coefs[:, :k].copy()
+        coefs[:, :k] = prev - pacf[:, k, None] * prev[:, ::-1]
+        coefs[:, k] = pacf[:, k]
+    return coefs
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _loglik_batch(
+        params: np.ndarray, y: np.ndarray, x: np.ndarray, p: int, q: int, start: int
+    ) -> np.ndarray:
+        # Conditional log-likelihood of B regression-with-ARMA(p, q)-errors
+        # candidates, params[b] = (c, phi_1..phi_p, theta_1..theta_q, beta...).
+        # Candidates run in parallel; each walks the series sequentially from
+        # ``start`` (>= p) with pre-sample errors set to zero.
+        n_cand, n_obs, n_exog = params.shape[0], len(y), x.shape[1]
+        loglik = np.empty(n_cand)
+        for b in prange(n_cand):
+            u = np.empty(n_obs)
+            for t in range(n_obs):
+                v = y[t] - params[b, 0]
+                for k in range(n_exog):
+                    v -= x[t, k] * params[b, 1 + p + q + k]
+                u[t] = v
+            e = np.zeros(n_obs)
+            sse = 0.0
+            for t in range(start, n_obs):
+                v = u[t]
+                for i in range(p):
+                    v -= params[b, 1 + i] * u[t - 1 - i]
+                for j in range(q):
+                    if t - 1 - j >= 0:
+                        v -= params[b, 1 + p + j] * e[t - 1 - j]
+                e[t] = v
+                sse += v * v
+            n = n_obs - start
+            loglik[b] = -0.5 * n * (np.log(2.0 * np.pi * sse / n) + 1.0)
+        return loglik
+else:
+    def _loglik_batch(
+        params: np.ndarray, y: np.ndarray, x: np.ndarray, p: int, q: int, start: int
+    ) -> np.ndarray:
+        # Same recursion as the compiled kernel, vectorised over candidates
+        phi, theta, beta = params[:, 1:1 + p], params[:, 1 + p:1 + p + q], params[:, 1 + p + q:]
+        u = y[None, :] - params[:, :1] - beta @ x.T
+        e_prev = np.zeros((len(params), q))
+        sse = np.zeros(len(params))
+        for t in range(start, len(y)):
+            e_t = u[:, t] - (phi * u[:, t - p:t][:, ::-1]).sum(axis=1) - (theta * e_prev).sum(axis=1)
+            if q:
+                e_prev[:, 1:] = e_prev[:, :-1]
+                e_prev[:, 0] = e_t
+            sse += e_t ** 2
+        n = len(y) - start
+        return -0.5 * n * (np.log(2 * np.pi * sse / n) + 1)
+
+
+def _pacf_params(z: np.ndarray, p: int, q: int) -> np.ndarray:
+    """Map unconstrained rows ``z`` (shape ``(B, p + q)``) to ``_loglik_batch`` params."""
+    pacf = np.tanh(z)
+    ar = _pacf_to_coefs(pacf[:, :p])
+    ma = -_pacf_to_coefs(pacf[:, p:])
+    return np.column_stack([np.zeros(len(z)), ar, ma])
+
+
+def _refine_order(z0: np.ndarray, u: np.ndarray, p: int, q: int, start: int, maxiter: int = 50) -> float:
+    """Polish the best candidate of an order with a few L-BFGS steps.
+
+    The search runs on ``arctanh`` of the partial autocorrelations, so
+    every step stays stationary and invertible. The objective and its
+    forward-difference gradient are evaluated in one batched call to
+    :func:`_loglik_batch`. Returns the refined log-likelihood.
+    """
+    x = np.zeros((len(u), 0))
+    k = len(z0)
+    step = 1e-6
+
+    def objective(z: np.ndarray) -> Tuple[float, np.ndarray]:
+        batch = np.vstack([z, z + step * np.eye(k)])
+        nll = -_loglik_batch(_pacf_params(batch, p, q), u, x, p, q, start)
+        return nll[0], (nll[1:] - nll[0]) / step
+
+    opt = minimize(
+        objective, z0, jac=True, method="L-BFGS-B", bounds=[(-5.0, 5.0)] * k, options={"maxiter": maxiter}
+    )
+    return -min(opt.fun, objective(z0)[0])
+
+
+def search_order(
+    series: pd.Series,
+    exog: Optional[pd.DataFrame] = None,
+    p_max: int = 3,
+    q_max: int = 3,
+    d: int = 0,
+    n_candidates: int = 256,
+    random_state: Optional[int] = None,
+) -> Tuple[int, int, int]:
+    """Select the ARIMAX order ``(p, d, q)`` with the lowest AIC.
+
+    Parameters
+    ----------
+    series : pd.Series
+        The target time series.
+    exog : pd.DataFrame, optional
+        Exogenous regressors aligned with ``series``.
+    p_max, q_max : int
+        Largest autoregressive and moving-average orders to consider.
+        Default to 3.
+    d : int
+        Order of differencing applied to ``series`` (and ``exog``).
+        Defaults to 0.
+    n_candidates : int
+        Number of coefficient vectors evaluated per ``(p, q)``. Defaults
+        to 256.
+    random_state : int, optional
+        Seed for the candidate draws.
+
+    Returns
+    -------
+    tuple of (p, d, q)
+        The selected order, suitable for :func:`fit_arimax`.
+
+    Notes
+    -----
+    ARMA coefficients are parametrised by their partial autocorrelations,
+    which range freely over (-1, 1) for stationary and invertible models.
+    Candidates are therefore drawn uniformly on that cube and mapped to
+    coefficients directly, instead of rejection-sampling the coefficient
+    space. Exogenous effects are removed by least squares before the
+    search, and all orders are scored on the same observations. The
+    candidates of each order are evaluated in a single batched call to
+    :func:`_loglik_batch`, and the best one is refined with a few L-BFGS
+    steps when ``scipy`` is available, so that orders are compared near
+    their maximum likelihood rather than at a random draw. Pass
+    ``random_state`` for reproducible selections.
     """
-    if ARIMA is None:
-        return pd.Series([float('nan')] * forecast_steps)
+    y = series.to_numpy(dtype=np.float64)
+    X = np.ones((len(y), 0)) if exog is None else np.asarray(exog, dtype=np.float64)
+    y = np.diff(y, n=d)
+    X = np.diff(X, n=d, axis=0)
+    if d == 0:
+        X = np.column_stack([np.ones(len(y)), X])
+    u = y
+    if X.shape[1]:
+        u = y - X @ _ols(X, y)
 
-    model = ARIMA(series, order=order, exog=exog)
-    fitted = model.fit()
-    forecast = fitted.get_forecast(steps=forecast_steps, exog=exog.iloc[-forecast_steps:] if exog is not None else None)
-    return forecast.predicted_mean
+    rng = np.random.default_rng(random_state)
+    best_order, best_aic = (0, d, 0), np.inf
+    for p in range(p_max + 1):
+        for q in range(q_max + 1):
+            n_cand = n_candidates if p + q else 1
+            z = np.arctanh(rng.uniform(-1, 1, size=(n_cand, p + q)))
+            loglik = _loglik_batch(_pacf_params(z, p, q), u, np.zeros((len(u), 0)), p, q, p_max)
+            if p + q and minimize is not None:
+                loglik = _refine_order(z[np.argmax(loglik)], u, p, q, p_max)
+            else:
+                loglik = loglik.max()
+            aic = -2 * loglik + 2 * (p + q + X.shape[1] + 1)
+            if aic < best_aic:
+                best_order, best_aic = (p, d, q), aic
+    return best_order
@@ -0,0 +1,169 @@
+"""
+Pluggable ARIMA backends for the forecasting models.
+
+Fitting the ARIMA mean equation is the dominant cost of the
+pipeline. ``statsmodels`` estimates the model through a Python-level
+Kalman filter, which is flexible but slow when the same specification
+is fitted repeatedly (e.g. for both the ARIMAX and ARIMAX–GARCH
+models, or across rolling windows). Nixtla's ``statsforecast``
+implements the same estimator with compiled kernels and is used by
+default when installed.
+
+Every backend follows the small :class:`ModelBackend` protocol
+(``fit``, ``predict``, ``apply`` and ``resid``) so that model code can
+stay agnostic of the library doing the numerical work.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Protocol, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+try:
+    from statsforecast.arima import forward_arima
+    from statsforecast.models import ARIMA as SFARIMA
+except ImportError:
+    SFARIMA = None  # type: ignore
+
+try:
+    from statsmodels.tsa.arima.model import ARIMA
+except ImportError:
+    ARIMA = None  # type: ignore
+
+
+class ModelBackend(Protocol):
+    """Interface shared by all ARIMA backends."""
+
+    def fit(self, series: pd.Series, exog: Optional[pd.DataFrame] = None) -> "ModelBackend":
+        """Estimate the model on ``series`` and return ``self``."""
+        ...
+
+    def predict(self, steps: int, exog_future: Optional[pd.DataFrame] = None) -> pd.Series:
+        """Return point forecasts for the next ``steps`` periods."""
+        ...
+
+    def apply(self, series: pd.Series, exog: Optional[pd.DataFrame] = None) -> "ModelBackend":
+        """Return a copy of the model filtered on new data, keeping its parameters."""
+        ...
+
+    @property
+    def resid(self) -> pd.Series:
+        """In‑sample residuals of the fitted model."""
+        ...
+
+
+def forecast_index(index: pd.Index, steps: int) -> pd.Index:
+    """Build the index for ``steps`` periods following ``index``.
+
+    Date-time indexes are extended using their frequency (inferred if
+    not set) and a ``RangeIndex`` is continued with its step; any other
+    index falls back to integer positions, which mirrors the behaviour
+    of ``statsmodels``.
+    """
+    if isinstance(index, pd.DatetimeIndex):
+        freq = index.freq
+        if freq is None and len(index) >= 3:
+            freq = to_offset(pd.infer_freq(index))
+        if freq is not None:
+            return pd.date_range(start=index[-1] + freq, periods=steps, freq=freq)
+    if isinstance(index, pd.RangeIndex) and len(index):
+        return pd.RangeIndex(index.stop, index.stop + steps * index.step, index.step)
+    return pd.RangeIndex(len(index), len(index) + steps)
+
+
+def _all_finite(series: pd.Series, exog: Optional[pd.DataFrame] = None) -> bool:
+    """Return True if ``series`` and ``exog`` contain no NaN or infinite values."""
+    if not np.isfinite(series.to_numpy(dtype=np.float64)).all():
+        return False
+    return exog is None or bool(np.isfinite(np.asarray(exog, dtype=np.float64)).all())
+
+
+class StatsForecastArima:
+    """ARIMA backend built on ``statsforecast``'s compiled estimator.
+
+    Unlike the state-space backend, ``statsforecast`` cannot fit
+    through missing values: :meth:`fit` and :meth:`apply` raise
+    ``ValueError`` if the data are not finite. :meth:`apply` relies on
+    the private ``statsforecast.arima.forward_arima`` of statsforecast
+    2.x.
+    """
+
+    def __init__(self, order: Tuple[int, int, int] = (1, 0, 1)) -> None:
+        self.order = order
+        self.model = None
+        self._index: Optional[pd.Index] = None
+
+    def fit(self, series: pd.Series, exog: Optional[pd.DataFrame] = None) -> "StatsForecastArima":
+        if not _all_finite(series, exog):
+            raise ValueError("statsforecast cannot fit series or exog with missing or infinite values")
+        X = None if exog is None else np.asarray(exog, dtype=np.float64)
+        self.model = SFARIMA(order=self.order).fit(y=series.to_numpy(dtype=np.float64), X=X)
+        self._index = series.index
+        return self
+
+    def predict(self, steps: int, exog_future: Optional[pd.DataFrame] = None) -> pd.Series:
+        X = None if exog_future is None else np.asarray(exog_future, dtype=np.float64)
+        mean = self.model.predict(h=steps, X=X)["mean"]
+        return pd.Series(mean, index=forecast_index(self._index, steps), name="predicted_mean")
+
+    def apply(self, series: pd.Series, exog: Optional[pd.DataFrame] = None) -> "StatsForecastArima":
+        if not _all_finite(series, exog):
+            raise ValueError("statsforecast cannot filter series or exog with missing or infinite values")
+        X = None if exog is None else np.asarray(exog, dtype=np.float64)
+        applied = StatsForecastArima(self.order)
+        applied.model = SFARIMA(order=self.order)
+        # Same as statsforecast's ARIMA.forward, which does not expose residuals
+        applied.model.model_ = forward_arima(
+            self.model.model_, y=series.to_numpy(dtype=np.float64), xreg=X, method=self.model.method
+        )
+        applied._index = series.index
+        return applied
+
+    @property
+    def resid(self) -> pd.Series:
+        return pd.Series(self.model.model_["residuals"], index=self._index)
+
+
+class StatsmodelsArima:
+    """ARIMA backend wrapping ``statsmodels``' state-space implementation."""
+
+    def __init__(self, order: Tuple[int, int, int] = (1, 0, 1)) -> None:
+        self.order = order
+        self.results = None
+
+    def fit(self, series: pd.Series, exog: Optional[pd.DataFrame] = None) -> "StatsmodelsArima":
+        self.results = ARIMA(series, order=self.order, exog=exog).fit()
+        return self
+
+    def predict(self, steps: int, exog_future: Optional[pd.DataFrame] = None) -> pd.Series:
+        return self.results.get_forecast(steps=steps, exog=exog_future).predicted_mean
+
+    def apply(self, series: pd.Series, exog: Optional[pd.DataFrame] = None) -> "StatsmodelsArima":
+        applied = StatsmodelsArima(self.order)
+        applied.results = self.results.apply(series, exog=exog, refit=False)
+        return applied
+
+    @property
+    def resid(self) -> pd.Series:
+        return self.results.resid
+
+
+def _fit_arima_backend(
+    series: pd.Series,
+    exog: Optional[pd.DataFrame],
+    order: Tuple[int, int, int],
+) -> Optional[ModelBackend]:
+    """Fit an ARIMA(X) model with the fastest available backend.
+
+    Series with missing values go to ``statsmodels``, whose Kalman
+    filter fits through the gaps. Returns ``None`` if neither
+    ``statsforecast`` nor ``statsmodels`` is installed.
+    """
+    if SFARIMA is not None and (ARIMA is None or _all_finite(series, exog)):
+        return StatsForecastArima(order).fit(series, exog)
+    if ARIMA is not None:
+        return StatsmodelsArima(order).fit(series, exog)
+    return None
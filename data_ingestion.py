@@ -17,11 +17,99 @@ objects and leave further feature engineering to downstream modules.
 
 from __future__ import annotations
 
+from pathlib import Path
 import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None  # type: ignore
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None  # type: ignore
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _hdd_cdd(temp: np.ndarray, base: float) -> np.ndarray:
+        # Single pass over ``temp`` writing HDD and CDD side by side in the
+        # input dtype; NaN temperatures propagate to NaN degree days as with
+        # ``np.maximum``. Numba compiles one specialisation per dtype.
+        out = np.empty((len(temp), 2), dtype=temp.dtype)
+        for i in prange(len(temp)):
+            t = temp[i]
+            if np.isnan(t):
+                out[i, 0] = np.nan
+                out[i, 1] = np.nan
+            else:
+                out[i, 0] = max(0.0, base - t)
+                out[i, 1] = max(0.0, t - base)
+        return out
+
+    # Compile once at import so the first pipeline run does not pay for it
+    _hdd_cdd(np.zeros(1, dtype=np.float32), 0.0)
+    _hdd_cdd(np.zeros(1, dtype=np.float64), 0.0)
+else:
+    def _hdd_cdd(temp: np.ndarray, base: float) -> np.ndarray:
+        out = np.empty((len(temp), 2), dtype=temp.dtype)
+        np.maximum(0, base - temp, out=out[:, 0])
+        np.maximum(0, temp - base, out=out[:, 1])
+        return out
+
+
+def _read_table(file_path: str) -> pd.DataFrame:
+    """Read a time-indexed table from a Parquet or CSV file.
+
+    Files with a ``.parquet`` suffix are memory-mapped and read with
+    pyarrow, which avoids parsing text entirely. Anything else is
+    treated as CSV whose first column is the timestamp index, parsed
+    with pyarrow's multi-threaded reader when it is installed (or a
+    memory-mapped C reader otherwise). Timestamp indexes are normalised
+    to a nanosecond ``DatetimeIndex`` so that tables from either format
+    align; other indexes (e.g. integers) are returned as the C reader
+    would parse them.
+    """
+    if Path(file_path).suffix.lower() == ".parquet":
+        df = pd.read_parquet(file_path, engine="pyarrow", memory_map=True)
+    elif pyarrow is not None:
+        df = pd.read_csv(file_path, parse_dates=True, index_col=0, engine="pyarrow")
+        # pyarrow names an unnamed index column '' where the C reader uses None
+        if df.index.name == "":
+            df.index.name = None
+    else:
+        df = pd.read_csv(file_path, parse_dates=True, index_col=0, memory_map=True)
+    if df.index.dtype == object:
+        # pyarrow reads date-only columns as ``datetime.date`` objects
+        try:
+            df.index = pd.to_datetime(df.index)
+        except (TypeError, ValueError):
+            return df
+    if isinstance(df.index, pd.DatetimeIndex):
+        df.index = df.index.as_unit("ns")
+    return df
+
+
+def convert_csv_to_parquet(csv_path: str, parquet_path: str) -> None:
+    """Convert a CSV input file to Parquet for faster repeated loading.
+
+    This is a one-time step: the loaders in this module accept the
+    resulting ``.parquet`` file anywhere a CSV path is expected.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to a CSV file whose first column is a timestamp index.
+    parquet_path : str
+        Destination path, conventionally with a ``.parquet`` suffix.
+    """
+    _read_table(csv_path).to_parquet(parquet_path, engine="pyarrow")
+
+
 def load_price_data(file_path: str) -> pd.DataFrame:
-    """Load energy price data from a CSV file.
+    """Load energy price data from a CSV or Parquet file.
 
     The expected format is a table with a date‑time index and one or more
     columns representing different price series (e.g. day‑ahead LMP and
@@ -31,7 +119,7 @@ def load_price_data(file_path: str) -> pd.DataFrame:
     Parameters
     ----------
     file_path : str
-        Path to a CSV file containing the raw price data.
+        Path to a CSV or ``.parquet`` file containing the raw price data.
 
     Returns
     -------
@@ -46,15 +134,13 @@ def load_price_data(file_path: str) -> pd.DataFrame:
     incorporated【929455163347937†L28-L36】. This function provides a
     simple starting point for loading such data.
     """
-    df = pd.read_csv(file_path, parse_dates=True, index_col=0)
+    df = _read_table(file_path)
     # Ensure numeric columns
-    for col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    return df
+    return df.apply(pd.to_numeric, errors="coerce")
 
 
 def load_weather_data(file_path: str) -> pd.DataFrame:
-    """Load weather data (e.g. temperature) from a CSV file.
+    """Load weather data (e.g. temperature) from a CSV or Parquet file.
 
     Weather variables like Heating Degree Days (HDD) and Cooling Degree
     Days (CDD) are commonly used exogenous drivers in energy price
@@ -64,15 +150,19 @@ def load_weather_data(file_path: str) -> pd.DataFrame:
     Parameters
     ----------
     file_path : str
-        Path to a CSV file with columns such as ``temperature``.
+        Path to a CSV or ``.parquet`` file with columns such as
+        ``temperature``.
 
     Returns
     -------
     pd.DataFrame
-        DataFrame indexed by timestamps with weather variables.
+        DataFrame indexed by timestamps with weather variables. The
+        ``temperature`` column is stored as ``float32``, which is ample
+        precision for temperatures and halves the memory traffic of the
+        degree-day computation.
     """
-    df = pd.read_csv(file_path, parse_dates=True, index_col=0)
-    df["temperature"] = pd.to_numeric(df["temperature"], errors="coerce")
+    df = _read_table(file_path)
+    df["temperature"] = pd.to_numeric(df["temperature"], errors="coerce").astype(np.float32)
     return df
 
 
@@ -99,15 +189,40 @@ def compute_degree_days(temperature: pd.Series, base_temperature: float = 18.0)
     pd.DataFrame
         DataFrame with two columns: ``HDD`` and ``CDD``.
     """
-    # Ensure numeric input
-    temp = temperature.astype(float)
-    hdd = np.maximum(0, base_temperature - temp)
-    cdd = np.maximum(0, temp - base_temperature)
-    return pd.DataFrame({"HDD": hdd, "CDD": cdd}, index=temp.index)
+    degree_days = compute_degree_days_array(temperature.to_numpy(), base_temperature)
+    return pd.DataFrame(degree_days, index=temperature.index, columns=["HDD", "CDD"])
+
+
+def compute_degree_days_array(temp_values: np.ndarray, base_temperature: float = 18.0) -> np.ndarray:
+    """Compute HDD and CDD for a plain array of temperatures.
+
+    Array counterpart of :func:`compute_degree_days` for callers that
+    align the result themselves and want to avoid building an
+    intermediate DataFrame.
+
+    Parameters
+    ----------
+    temp_values : np.ndarray
+        One-dimensional array of average temperatures.
+    base_temperature : float, optional
+        The base temperature in degrees Celsius. Defaults to 18°C.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape ``(N, 2)`` holding HDD in the first column and
+        CDD in the second, in ``float32`` for ``float32`` input and
+        ``float64`` otherwise.
+    """
+    # Ensure numeric input, keeping single precision if given
+    temp = np.ascontiguousarray(temp_values)
+    if temp.dtype != np.float32:
+        temp = temp.astype(np.float64, copy=False)
+    return _hdd_cdd(temp, float(base_temperature))
 
 
 def load_sentiment_scores(file_path: str) -> pd.Series:
-    """Load pre‑computed sentiment scores from a CSV file.
+    """Load pre‑computed sentiment scores from a CSV or Parquet file.
 
     Sentiment analysis has been shown to improve financial forecasting
     models when used as an exogenous signal. For instance, a study
@@ -120,12 +235,12 @@ def load_sentiment_scores(file_path: str) -> pd.Series:
     Parameters
     ----------
     file_path : str
-        Path to the CSV containing sentiment scores.
+        Path to the CSV or ``.parquet`` file containing sentiment scores.
 
     Returns
     -------
     pd.Series
         Series of sentiment scores indexed by timestamp.
     """
-    df = pd.read_csv(file_path, parse_dates=True, index_col=0)
+    df = _read_table(file_path)
     return df.iloc[:, 0].astype(float)
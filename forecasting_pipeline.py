@@ -29,9 +29,12 @@ intended to be extended and customised for specific use cases.
 
 from __future__ import annotations
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from . import data_ingestion
@@ -49,11 +52,61 @@ class PipelineResult:
     vecm_forecast: Optional[pd.DataFrame]
 
 
+def _fit_univariate(
+    series: pd.Series,
+    exog: pd.DataFrame,
+    arima_order: Optional[Tuple[int, int, int]],
+    forecast_steps: int,
+    random_state: Optional[int] = None,
+) -> Tuple[pd.Series, pd.Series]:
+    """Fit the ARIMAX mean and GARCH volatility models on one price series.
+
+    Returns the mean and variance forecasts. Defined at module level so
+    that it can be run in a worker process.
+    """
+    if arima_order is None:
+        arima_order = arimax.search_order(series, exog=exog, random_state=random_state)
+
+    # Fit ARIMAX baseline once; its forecasts double as the ARIMAX–GARCH mean
+    arimax_forecast, mean_fit = arimax.fit_arimax(
+        series, exog=exog, order=arima_order, forecast_steps=forecast_steps, return_model=True
+    )
+
+    # Fit GARCH on the ARIMAX residuals
+    garch_vol = pd.Series([float('nan')] * forecast_steps)
+    if mean_fit is not None:
+        _, garch_vol = arimax_garch.fit_garch_on_resid(mean_fit.resid, horizon=forecast_steps)
+    return arimax_forecast, garch_vol
+
+
+def _fit_multivariate(price_df: pd.DataFrame, forecast_steps: int) -> pd.DataFrame:
+    """Fit the VECM–GARCH model on all price series and return its forecasts."""
+    return vecm_garch.fit_vecm_garch(price_df, forecast_steps=forecast_steps).forecast
+
+
+def _align_degree_days(temperature: pd.Series, index: pd.DatetimeIndex) -> pd.DataFrame:
+    """Return HDD and CDD of ``temperature`` forward-filled onto ``index``.
+
+    Equivalent to ``compute_degree_days(temperature).reindex(index,
+    method="ffill")``: each timestamp takes the last observation at or
+    before it, and timestamps before the first observation are NaN.
+    Both indexes must be sorted.
+    """
+    degree_days = data_ingestion.compute_degree_days_array(temperature.to_numpy())
+    pos = np.searchsorted(temperature.index.values, index.values, side="right") - 1
+    aligned = degree_days[pos]
+    aligned[pos < 0] = np.nan
+    return pd.DataFrame(aligned, index=index, columns=["HDD", "CDD"])
+
+
 def run_pipeline(
     price_path: str,
     weather_path: str,
     sentiment_path: Optional[str] = None,
     forecast_steps: int = 24,
+    arima_order: Optional[Tuple[int, int, int]] = (1, 0, 1),
+    parallel: bool = False,
+    random_state: Optional[int] = 0,
 ) -> PipelineResult:
     """Execute the end‑to‑end forecasting pipeline.
 
@@ -68,40 +121,77 @@ def run_pipeline(
         will be merged into the exogenous feature set.
     forecast_steps : int
         Number of steps ahead to forecast. Defaults to 24.
+    arima_order : tuple of (p, d, q), optional
+        Order of the ARIMAX mean equation. Defaults to (1, 0, 1). If
+        None, the order is selected with :func:`arimax.search_order`.
+    parallel : bool
+        Fit the univariate (ARIMAX and GARCH) and multivariate (VECM)
+        models in separate processes when both are needed. Defaults to
+        False; see Notes.
+    random_state : int, optional
+        Seed for the order search when ``arima_order`` is None, so that
+        repeated runs select the same order. Defaults to 0.
 
     Returns
     -------
     PipelineResult
         A dataclass containing the forecasts from each model.
+
+    Notes
+    -----
+    With ``parallel=True`` worker processes are started with the
+    ``spawn`` method, so scripts calling this function must do so from
+    under an ``if __name__ == "__main__":`` guard. Each worker imports
+    the libraries and compiles the Numba kernels afresh, which for
+    inputs of the current size costs far more than the fits it runs
+    concurrently; enable it only for long series where each model
+    takes seconds to fit.
     """
     # Stage 1: Load data
     price_df = data_ingestion.load_price_data(price_path)
     weather_df = data_ingestion.load_weather_data(weather_path)
 
+    # Alignment below needs sorted timestamps; sort once if necessary
+    for df in (price_df, weather_df):
+        if not df.index.is_monotonic_increasing:
+            df.sort_index(inplace=True)
+
     # Stage 2: Feature engineering
-    degree_days = data_ingestion.compute_degree_days(weather_df["temperature"])
-    exog = degree_days.reindex(price_df.index, method="ffill")
+    # Forward-fill degree days onto the price timestamps by gathering the
+    # last weather observation at or before each price
+    exog = _align_degree_days(weather_df["temperature"], price_df.index)
 
     # Incorporate sentiment if provided
     if sentiment_path is not None:
         sentiment = data_ingestion.load_sentiment_scores(sentiment_path)
-        exog["sentiment"] = sentiment.reindex(price_df.index, method="ffill")
+        if not sentiment.index.is_monotonic_increasing:
+            sentiment = sentiment.sort_index()
+        exog = pd.merge_asof(
+            exog, sentiment.rename("sentiment").to_frame(), left_index=True, right_index=True, direction="backward"
+        )
 
     # Stage 3: Model fitting
-    # Fit ARIMAX baseline
-    arimax_forecast = arimax.fit_arimax(price_df.iloc[:, 0], exog=exog, forecast_steps=forecast_steps)
-
-    # Fit ARIMAX–GARCH
-    result_garch = arimax_garch.fit_arimax_garch(price_df.iloc[:, 0], exog=exog, forecast_steps=forecast_steps)
-
-    # Fit VECM–GARCH on all price series if more than one exists
-    vecm_res = None
-    if price_df.shape[1] > 1:
-        vecm_res = vecm_garch.fit_vecm_garch(price_df, forecast_steps=forecast_steps)
+    series = price_df.iloc[:, 0]
+    vecm_forecast = None
+    if price_df.shape[1] > 1 and parallel:
+        # The two model families are independent; fit them side by side.
+        # Workers are spawned rather than forked, since forking after the
+        # Numba/BLAS thread pools have started can deadlock.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=2, mp_context=context) as pool:
+            univariate = pool.submit(_fit_univariate, series, exog, arima_order, forecast_steps, random_state)
+            multivariate = pool.submit(_fit_multivariate, price_df, forecast_steps)
+            arimax_forecast, garch_vol = univariate.result()
+            vecm_forecast = multivariate.result()
+    else:
+        arimax_forecast, garch_vol = _fit_univariate(series, exog, arima_order, forecast_steps, random_state)
+        # Fit VECM–GARCH on all price series if more than one exists
+        if price_df.shape[1] > 1:
+            vecm_forecast = _fit_multivariate(price_df, forecast_steps)
 
     return PipelineResult(
         arimax_forecast=arimax_forecast,
-        arimax_garch_mean=result_garch.forecast_mean,
-        arimax_garch_vol=result_garch.forecast_vol,
-        vecm_forecast=vecm_res.forecast if vecm_res else None,
+        arimax_garch_mean=arimax_forecast,
+        arimax_garch_vol=garch_vol,
+        vecm_forecast=vecm_forecast,
     )
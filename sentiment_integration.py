@@ -18,23 +18,140 @@ offload sentiment scoring to a separate service.
 
 from __future__ import annotations
 
-from typing import Iterable, List
+import functools
+import hashlib
+import os
+import shelve
+from pathlib import Path
+from typing import Iterable, List, Optional
 
+import numpy as np
 import pandas as pd
 
 try:
-    from transformers import pipeline
+    from transformers import AutoTokenizer, pipeline
 except ImportError:
     pipeline = None  # type: ignore
 
+try:
+    import torch
+except ImportError:
+    torch = None  # type: ignore
+
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:
+    ORTModelForSequenceClassification = None  # type: ignore
+    ORTQuantizer = None  # type: ignore
+    AutoQuantizationConfig = None  # type: ignore
+
+
+_FINBERT = "ProsusAI/finbert"
+
+# Directory holding cached models and sentiment scores (override with ENERGY_FORECAST_CACHE)
+_CACHE_DIR = Path(os.environ.get("ENERGY_FORECAST_CACHE", Path.home() / ".cache" / "energy_price_forecasting"))
+
+
+def _default_device() -> int:
+    """Return the first CUDA device if available, otherwise the CPU (-1)."""
+    if torch is not None and torch.cuda.is_available():
+        return 0
+    return -1
+
+
+def _default_dtype(device: int) -> str:
+    """Return half precision on GPU, INT8 on CPU if ONNX Runtime is available."""
+    if device >= 0:
+        return "float16"
+    if ORTModelForSequenceClassification is not None:
+        return "int8"
+    return "float32"
+
+
+def _quantized_model_dir() -> Path:
+    """Export FinBERT to ONNX with dynamic INT8 quantisation, once per cache directory."""
+    quantized_dir = _CACHE_DIR / "finbert-onnx-int8"
+    if not (quantized_dir / "model_quantized.onnx").exists():
+        model = ORTModelForSequenceClassification.from_pretrained(_FINBERT, export=True)
+        quantizer = ORTQuantizer.from_pretrained(model)
+        qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=quantized_dir, quantization_config=qconfig)
+    return quantized_dir
+
 
-def compute_finbert_sentiment(texts: Iterable[str]) -> pd.Series:
+@functools.lru_cache(maxsize=1)
+def _get_pipeline(device: int, dtype: str):
+    """Return the FinBERT pipeline for ``device`` and ``dtype``.
+
+    The pipeline is cached so that model weights are loaded once per
+    process rather than on every call. ``dtype="int8"`` runs an INT8
+    quantised ONNX export of the model on CPU through ONNX Runtime; it
+    requires ``optimum`` and raises :class:`ImportError` without it, and
+    :class:`ValueError` if a GPU ``device`` is requested.
+    """
+    if dtype == "int8":
+        if ORTModelForSequenceClassification is None:
+            raise ImportError(
+                "dtype='int8' requires optimum with ONNX Runtime (pip install optimum[onnxruntime])"
+            )
+        if device >= 0:
+            raise ValueError("dtype='int8' runs on CPU only; use device=-1 or a floating-point dtype")
+        model = ORTModelForSequenceClassification.from_pretrained(
+            _quantized_model_dir(), file_name="model_quantized.onnx"
+        )
+        tokenizer = AutoTokenizer.from_pretrained(_FINBERT)
+        return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+
+    kwargs = {}
+    if torch is not None:
+        kwargs["torch_dtype"] = getattr(torch, dtype)
+    # Load FinBERT sentiment pipeline (may download model weights)
+    return pipeline("sentiment-analysis", model=_FINBERT, device=device, **kwargs)
+
+
+def _text_key(text: str) -> str:
+    """Return the disk-cache key for ``text``."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _signed_scores(results: List[dict]) -> np.ndarray:
+    """Collapse FinBERT label/probability pairs into signed scores."""
+    labels = np.array([result["label"].lower() for result in results])
+    scores = np.array([result["score"] for result in results], dtype=np.float32)
+    return np.select([labels == "positive", labels == "negative"], [scores, -scores], default=np.float32(0.0))
+
+
+def compute_finbert_sentiment(
+    texts: Iterable[str],
+    device: Optional[int] = None,
+    batch_size: int = 64,
+    dtype: Optional[str] = None,
+    use_cache: bool = True,
+) -> pd.Series:
     """Compute FinBERT sentiment scores for a collection of texts.
 
     Parameters
     ----------
     texts : Iterable[str]
         An iterable of news headlines or articles.
+    device : int, optional
+        Device to run the model on: ``-1`` for CPU or a CUDA device
+        ordinal. Defaults to the first GPU if one is available.
+    batch_size : int
+        Number of texts passed through the model at once. Defaults
+        to 64.
+    dtype : str, optional
+        Torch dtype name for the model weights, or ``"int8"`` for an
+        INT8 quantised ONNX Runtime model on CPU. Defaults to
+        ``"float16"`` on GPU, and on CPU to ``"int8"`` when ``optimum``
+        with ONNX Runtime is installed and ``"float32"`` otherwise.
+        ``"int8"`` cannot be combined with a GPU ``device`` and requires
+        ``optimum``.
+    use_cache : bool
+        Look up and store scores in an on‑disk cache keyed by a hash
+        of each text, so repeated headlines are scored only once across
+        runs. Defaults to True.
 
     Returns
     -------
@@ -47,24 +164,44 @@ def compute_finbert_sentiment(texts: Iterable[str]) -> pd.Series:
     available, this function returns zeros for all input texts. The
     FinBERT model assigns probabilities to ``positive``, ``negative``
     and ``neutral`` classes; here we collapse the probabilities to a
-    single score by subtracting negative from positive.
+    single score by subtracting negative from positive. The model is
+    loaded on the first call and reused afterwards. Cached scores and
+    the quantised model are kept under ``ENERGY_FORECAST_CACHE`` (by
+    default ``~/.cache/energy_price_forecasting``), with scores stored
+    separately per ``dtype``.
     """
+    # Materialise once: ``texts`` may be a single-use iterator
+    texts_list = list(texts)
     if pipeline is None:
         # transformers is not installed; return zero scores
-        return pd.Series([0.0] * len(list(texts)))
+        return pd.Series(np.zeros(len(texts_list), dtype=np.float32))
 
-    # Load FinBERT sentiment pipeline (may download model weights)
-    sentiment_pipeline = pipeline("sentiment-analysis", model="ProsusAI/finbert")
-
-    scores: List[float] = []
-    for text in texts:
-        result = sentiment_pipeline(text, truncation=True)[0]
-        label = result["label"].lower()
-        score = result["score"]
-        if label == "positive":
-            scores.append(score)
-        elif label == "negative":
-            scores.append(-score)
-        else:
-            scores.append(0.0)
+    if device is None:
+        device = _default_device()
+    if dtype is None:
+        dtype = _default_dtype(device)
+
+    if not use_cache:
+        results = _get_pipeline(device, dtype)(texts_list, batch_size=batch_size, truncation=True, padding=True)
+        return pd.Series(_signed_scores(results))
+
+    keys = [_text_key(text) for text in texts_list]
+    scores = np.empty(len(texts_list), dtype=np.float32)
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with shelve.open(str(_CACHE_DIR / f"finbert_{dtype}")) as cache:
+        missing = []
+        for i, key in enumerate(keys):
+            if key in cache:
+                scores[i] = cache[key]
+            else:
+                missing.append(i)
+
+        # Only run the model on texts not seen in previous runs
+        if missing:
+            results = _get_pipeline(device, dtype)(
+                [texts_list[i] for i in missing], batch_size=batch_size, truncation=True, padding=True
+            )
+            scores[missing] = _signed_scores(results)
+            for i in missing:
+                cache[keys[i]] = float(scores[i])
     return pd.Series(scores)
@@ -0,0 +1,20 @@
+"""
+Test configuration.
+
+The modules of this repository use relative imports and are used as the
+``Energy_Price_Forecasting`` package (see the README). Register the
+repository root under that name so the tests can import it regardless of
+the directory the repository was checked out into.
+"""
+
+import importlib.machinery
+import importlib.util
+import sys
+from pathlib import Path
+
+_PACKAGE = "Energy_Price_Forecasting"
+
+if _PACKAGE not in sys.modules:
+    _spec = importlib.machinery.ModuleSpec(_PACKAGE, None, is_package=True)
+    _spec.submodule_search_locations = [str(Path(__file__).resolve().parents[1])]
+    sys.modules[_PACKAGE] = importlib.util.module_from_spec(_spec)
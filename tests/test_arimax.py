@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("numba")
+pytest.importorskip("scipy")
+
+from Energy_Price_Forecasting import arimax  # noqa: E402
+
+
+def _simulate(seed, n=1000):
+    rng = np.random.default_rng(seed)
+    e = rng.normal(size=n)
+    u = np.zeros(n)
+    for t in range(1, n):
+        u[t] = 0.6 * u[t - 1] + e[t] + 0.3 * e[t - 1]
+    return pd.Series(50.0 + u)
+
+
+def test_search_order_is_reproducible():
+    series = _simulate(0)
+    orders = {arimax.search_order(series, n_candidates=32, random_state=7) for _ in range(3)}
+    assert len(orders) == 1
+
+
+def test_search_order_selects_arma11():
+    assert arimax.search_order(_simulate(1), random_state=0) == (1, 0, 1)
+
+
+def test_refine_order_improves_best_candidate():
+    u = _simulate(2).to_numpy()
+    u = u - u.mean()
+    z = np.arctanh(np.random.default_rng(0).uniform(-1, 1, size=(64, 2)))
+    loglik = arimax._loglik_batch(arimax._pacf_params(z, 1, 1), u, np.zeros((len(u), 0)), 1, 1, 1)
+    refined = arimax._refine_order(z[np.argmax(loglik)], u, 1, 1, 1)
+    assert refined >= loglik.max()
+
+    # The refined fit is at least as likely as the true coefficients
+    exact = arimax._loglik_batch(np.array([[0.0, 0.6, 0.3]]), u, np.zeros((len(u), 0)), 1, 1, 1)[0]
+    assert refined >= exact
+
+
+def _simulate_exog(seed, n=1000):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-01", periods=n, freq="h")
+    exog = pd.DataFrame({"HDD": rng.gamma(2.0, 2.0, size=n)}, index=index)
+    series = _simulate(seed, n).set_axis(index) + 1.5 * exog["HDD"]
+    return series, exog
+
+
+def test_fit_arimax_matches_statsmodels():
+    from statsmodels.tsa.arima.model import ARIMA
+
+    series, exog = _simulate_exog(3)
+    forecast, fitted = arimax.fit_arimax(series, exog=exog, forecast_steps=12, return_model=True)
+    assert isinstance(fitted, arimax.NumbaArma11)
+
+    # fit_arimax reuses the last ``forecast_steps`` rows of exog as its future values
+    expected = ARIMA(series, order=(1, 0, 1), exog=exog).fit()
+    expected = expected.get_forecast(12, exog=exog.iloc[-12:]).predicted_mean
+    pd.testing.assert_index_equal(forecast.index, expected.index)
+    np.testing.assert_allclose(forecast, expected, rtol=1e-3)
+
+
+def test_fit_arimax_with_missing_prices():
+    series, exog = _simulate_exog(4)
+    series.iloc[[5, 400, 401]] = np.nan
+
+    forecast, fitted = arimax.fit_arimax(series, exog=exog, forecast_steps=6, return_model=True)
+    assert not isinstance(fitted, arimax.NumbaArma11)
+    assert np.isfinite(forecast).all()
+
+
+def test_failed_optimisation_falls_back(monkeypatch):
+    from scipy.optimize import OptimizeResult
+
+    series, exog = _simulate_exog(5, n=300)
+    failed = OptimizeResult(x=np.zeros(4), success=False, message="ABNORMAL")
+    monkeypatch.setattr(arimax, "minimize", lambda *args, **kwargs: failed)
+    with pytest.raises(RuntimeError, match="ABNORMAL"):
+        arimax.NumbaArma11().fit(series, exog)
+
+    forecast, fitted = arimax.fit_arimax(series, exog=exog, forecast_steps=6, return_model=True)
+    assert not isinstance(fitted, arimax.NumbaArma11)
+    assert np.isfinite(forecast).all()
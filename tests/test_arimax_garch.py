@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("numba")
+pytest.importorskip("scipy")
+arch = pytest.importorskip("arch")
+
+from Energy_Price_Forecasting import arimax, arimax_garch  # noqa: E402
+
+
+def _simulate(seed, n=1000, garch=True):
+    """ARMA(1, 1) prices whose innovations are GARCH(1, 1) or i.i.d. normal."""
+    rng = np.random.default_rng(seed)
+    z = rng.normal(size=n)
+    e = z.copy()
+    if garch:
+        s = 1.0
+        for t in range(1, n):
+            s = 0.1 + 0.1 * e[t - 1] ** 2 + 0.8 * s
+            e[t] = np.sqrt(s) * z[t]
+    u = np.zeros(n)
+    for t in range(1, n):
+        u[t] = 0.6 * u[t - 1] + e[t] + 0.3 * e[t - 1]
+    return pd.Series(50.0 + u)
+
+
+def _mean_resid(series):
+    _, fitted = arimax.fit_arimax(series, order=(1, 0, 1), return_model=True)
+    return fitted.resid
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_garch11_matches_arch_likelihood(seed):
+    # Seeds 5 and 10 previously drove omega to ~1e6 with unbounded SLSQP
+    resid = _mean_resid(_simulate(seed, garch=bool(seed % 2)))
+    fit, variance = arimax_garch.fit_garch_on_resid(resid, horizon=3)
+    reference = arch.arch_model(resid).fit(disp="off")
+
+    assert isinstance(fit, arimax_garch.Garch11Result)
+    assert fit.params["omega"] <= 10.0 * np.mean((resid - resid.mean()) ** 2)
+    assert fit.params["alpha[1]"] + fit.params["beta[1]"] < 1.0
+    own = arch.arch_model(resid).fix(fit.params.to_numpy()).loglikelihood
+    assert own >= reference.loglikelihood - 0.5
+    expected = reference.forecast(horizon=3).variance.iloc[-1]
+    assert list(variance.index) == list(expected.index)
+    assert np.all(np.isfinite(variance))
+    if seed % 2:
+        np.testing.assert_allclose(variance.to_numpy(), expected.to_numpy(), rtol=0.1)
+
+
+def test_garch11_nll_gradient():
+    from scipy.optimize import check_grad
+
+    e2 = _simulate(0).diff().dropna().to_numpy() ** 2
+    e2 /= e2.mean()
+    params = np.array([0.1, 0.15, 0.7])
+    err = check_grad(
+        lambda p: arimax_garch._garch11_nll(p, e2, 1.0)[0],
+        lambda p: arimax_garch._garch11_nll(p, e2, 1.0)[1],
+        params,
+    )
+    assert err < 1e-3 * np.abs(arimax_garch._garch11_nll(params, e2, 1.0)[1]).max()
+
+
+def test_workspace_reuses_parameters_across_windows():
+    series = _simulate(1, n=1200)
+    window, steps = 800, 6
+    workspace = arimax_garch.ArimaxGarchWorkspace(window, forecast_steps=steps)
+
+    first = workspace.forecast(series.iloc[:window])
+    expected = arimax_garch.fit_arimax_garch(series.iloc[:window], forecast_steps=steps)
+    np.testing.assert_allclose(first.forecast_mean, expected.forecast_mean)
+    np.testing.assert_allclose(first.forecast_vol, expected.forecast_vol)
+    params = first.vol_model.params.copy()
+
+    for start in (100, 200, 400):
+        current = series.iloc[start:start + window]
+        result = workspace.forecast(current)
+        pd.testing.assert_series_equal(result.vol_model.params, params)
+        assert result.forecast_mean.index.equals(pd.RangeIndex(start + window, start + window + steps))
+        assert np.all(np.isfinite(result.forecast_vol))
+        assert np.all(result.forecast_vol > 0)
+        # Fixed parameters stay close to a fresh fit on the same window
+        fresh = arimax_garch.fit_arimax_garch(current, forecast_steps=steps)
+        np.testing.assert_allclose(result.forecast_vol, fresh.forecast_vol, rtol=0.5)
+
+    refit = workspace.forecast(series.iloc[400:400 + window], refit=True)
+    np.testing.assert_allclose(refit.forecast_vol, fresh.forecast_vol)
+    np.testing.assert_allclose(refit.forecast_mean, fresh.forecast_mean)
@@ -0,0 +1,71 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("statsforecast")
+pytest.importorskip("statsmodels")
+
+from Energy_Price_Forecasting import backends  # noqa: E402
+
+
+def _simulate(seed, n=600, integrated=False):
+    """ARMA(2, 1) series with one exogenous regressor on an hourly index."""
+    rng = np.random.default_rng(seed)
+    e = rng.normal(size=n)
+    x = rng.normal(size=n)
+    u = np.zeros(n)
+    for t in range(2, n):
+        u[t] = 0.5 * u[t - 1] - 0.2 * u[t - 2] + e[t] + 0.4 * e[t - 1]
+    if integrated:
+        u = np.cumsum(u)
+    index = pd.date_range("2024-01-01", periods=n, freq="h")
+    return pd.Series(50.0 + 2.0 * x + u, index=index), pd.DataFrame({"x": x}, index=index)
+
+
+def _fit_pair(order, series, exog):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        reference = backends.StatsmodelsArima(order).fit(series, exog)
+    return backends.StatsForecastArima(order).fit(series, exog), reference
+
+
+@pytest.mark.parametrize("order, integrated", [((2, 0, 1), False), ((1, 1, 1), True)])
+def test_statsforecast_matches_statsmodels(order, integrated):
+    series, exog = _simulate(0, integrated=integrated)
+    fit, reference = _fit_pair(order, series.iloc[:-12], exog.iloc[:-12])
+
+    forecast = fit.predict(12, exog.iloc[-12:])
+    expected = reference.predict(12, exog.iloc[-12:])
+    pd.testing.assert_index_equal(forecast.index, expected.index)
+    np.testing.assert_allclose(forecast, expected, rtol=1e-4)
+    assert fit.resid.index.equals(series.index[:-12])
+    np.testing.assert_allclose(fit.resid.iloc[50:], reference.resid.iloc[50:], atol=1e-2)
+
+
+def test_statsforecast_apply_keeps_parameters():
+    series, exog = _simulate(1)
+    fit, reference = _fit_pair((2, 0, 1), series.iloc[:400], exog.iloc[:400])
+
+    applied = fit.apply(series.iloc[200:588], exog.iloc[200:588])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected = reference.apply(series.iloc[200:588], exog.iloc[200:588])
+    assert applied.model.model_["coef"] == fit.model.model_["coef"]
+    forecast = applied.predict(12, exog.iloc[-12:])
+    assert forecast.index.equals(series.index[-12:])
+    np.testing.assert_allclose(forecast, expected.predict(12, exog.iloc[-12:]), rtol=1e-4)
+
+
+def test_missing_values_fall_back_to_statsmodels():
+    series, exog = _simulate(2)
+    series.iloc[[10, 300]] = np.nan
+
+    with pytest.raises(ValueError, match="missing"):
+        backends.StatsForecastArima((2, 0, 1)).fit(series, exog)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        fitted = backends._fit_arima_backend(series, exog, (2, 0, 1))
+    assert isinstance(fitted, backends.StatsmodelsArima)
+    assert np.isfinite(fitted.predict(6, exog.iloc[-6:])).all()
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from Energy_Price_Forecasting import data_ingestion  # noqa: E402
+
+
+def _write(tmp_path, text):
+    path = tmp_path / "table.csv"
+    path.write_text(text)
+    return str(path)
+
+
+HOURLY = "timestamp,da,rt\n2024-01-01 00:00,10.5,11\n2024-01-01 01:00,x,12.5\n2024-01-01 02:00,9,13\n"
+DAILY = ",temperature\n2024-01-01,3.5\n2024-01-02,-1\n2024-01-03,20\n"
+INTEGER = ",sentiment\n10,0.5\n20,-0.25\n30,0\n"
+
+
+@pytest.mark.parametrize("text", [HOURLY, DAILY, INTEGER])
+def test_csv_engines_and_parquet_agree(tmp_path, monkeypatch, text):
+    csv_path = _write(tmp_path, text)
+    parquet_path = str(tmp_path / "table.parquet")
+    data_ingestion.convert_csv_to_parquet(csv_path, parquet_path)
+
+    from_pyarrow = data_ingestion._read_table(csv_path)
+    from_parquet = data_ingestion._read_table(parquet_path)
+    monkeypatch.setattr(data_ingestion, "pyarrow", None)
+    from_c = data_ingestion._read_table(csv_path)
+
+    pd.testing.assert_frame_equal(from_pyarrow, from_c)
+    pd.testing.assert_frame_equal(from_parquet, from_c)
+
+
+def test_date_only_index_is_datetime(tmp_path):
+    weather = data_ingestion.load_weather_data(_write(tmp_path, DAILY))
+    assert weather.index.equals(pd.DatetimeIndex(["2024-01-01", "2024-01-02", "2024-01-03"]).as_unit("ns"))
+    assert weather.index.name is None
+    assert weather["temperature"].dtype == np.float32
+
+
+def test_integer_index_is_kept(tmp_path):
+    sentiment = data_ingestion.load_sentiment_scores(_write(tmp_path, INTEGER))
+    assert sentiment.index.equals(pd.Index([10, 20, 30]))
+    assert sentiment.index.name is None
+
+
+def test_load_price_data_coerces_bad_cells(tmp_path):
+    prices = data_ingestion.load_price_data(_write(tmp_path, HOURLY))
+    assert prices.index.name == "timestamp"
+    assert prices.index.dtype == "datetime64[ns]"
+    assert np.isnan(prices.loc["2024-01-01 01:00", "da"])
+    assert prices["rt"].tolist() == [11.0, 12.5, 13.0]
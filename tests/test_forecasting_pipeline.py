@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Energy_Price_Forecasting import backends, data_ingestion, forecasting_pipeline
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_align_degree_days_matches_ffill(dtype):
+    rng = np.random.default_rng(0)
+    prices = pd.date_range("2024-01-01", periods=24 * 10, freq="h")
+    # Sparse, irregular weather starting after the first prices, with some
+    # timestamps coinciding exactly with prices and a missing reading
+    weather = pd.DatetimeIndex(sorted(
+        set(prices[rng.choice(np.arange(30, 240), size=20, replace=False)])
+        | set(prices[100:101] + pd.Timedelta(minutes=30))
+    ))
+    temperature = pd.Series(rng.normal(12.0, 8.0, size=len(weather)).astype(dtype), index=weather)
+    temperature.iloc[3] = np.nan
+
+    aligned = forecasting_pipeline._align_degree_days(temperature, prices)
+    expected = data_ingestion.compute_degree_days(temperature).reindex(prices, method="ffill")
+
+    pd.testing.assert_frame_equal(aligned, expected)
+    assert aligned.dtypes.eq(dtype).all()
+    assert aligned.loc[: weather[0] - pd.Timedelta(hours=1)].isna().all().all()
+    assert aligned.loc[weather[0]].notna().all()
+
+
+def _stub_multivariate(price_df, forecast_steps):
+    # Stands in for the VECM step in worker processes, which import this module
+    index = backends.forecast_index(price_df.index, forecast_steps)
+    return pd.DataFrame(np.tile(price_df.mean().to_numpy(), (forecast_steps, 1)), index=index, columns=price_df.columns)
+
+
+@pytest.fixture
+def pipeline_inputs(tmp_path):
+    rng = np.random.default_rng(1)
+    index = pd.date_range("2024-01-01", periods=400, freq="h", name="timestamp")
+    prices = pd.DataFrame(
+        {"da": 50.0 + rng.normal(size=400).cumsum() * 0.1, "rt": 52.0 + rng.normal(size=400)}, index=index
+    )
+    weather = pd.DataFrame({"temperature": rng.normal(10.0, 5.0, size=100)}, index=index[::4])
+    prices.to_csv(tmp_path / "price.csv")
+    weather.to_csv(tmp_path / "weather.csv")
+    return str(tmp_path / "price.csv"), str(tmp_path / "weather.csv")
+
+
+def test_parallel_pipeline_matches_sequential(pipeline_inputs, tmp_path, monkeypatch):
+    # Spawned workers import the package by name, so make it importable
+    # the way an installed checkout would be
+    site = tmp_path / "site"
+    site.mkdir()
+    (site / "Energy_Price_Forecasting").symlink_to(Path(forecasting_pipeline.__file__).parent)
+    monkeypatch.syspath_prepend(str(site))
+    monkeypatch.setattr(forecasting_pipeline, "_fit_multivariate", _stub_multivariate)
+
+    sequential = forecasting_pipeline.run_pipeline(*pipeline_inputs, forecast_steps=6)
+    parallel = forecasting_pipeline.run_pipeline(*pipeline_inputs, forecast_steps=6, parallel=True)
+
+    pd.testing.assert_series_equal(parallel.arimax_forecast, sequential.arimax_forecast)
+    pd.testing.assert_series_equal(parallel.arimax_garch_vol, sequential.arimax_garch_vol)
+    pd.testing.assert_frame_equal(parallel.vecm_forecast, sequential.vecm_forecast)
+    assert np.isfinite(parallel.arimax_forecast).all()
+    assert parallel.arimax_forecast.index.equals(pd.date_range("2024-01-17 16:00", periods=6, freq="h"))
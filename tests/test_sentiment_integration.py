@@ -0,0 +1,15 @@
+import pytest
+
+from Energy_Price_Forecasting import sentiment_integration
+
+
+def test_int8_without_optimum_raises(monkeypatch):
+    monkeypatch.setattr(sentiment_integration, "ORTModelForSequenceClassification", None)
+    with pytest.raises(ImportError, match="optimum"):
+        sentiment_integration._get_pipeline(-1, "int8")
+
+
+def test_int8_rejects_gpu_device(monkeypatch):
+    monkeypatch.setattr(sentiment_integration, "ORTModelForSequenceClassification", object())
+    with pytest.raises(ValueError, match="CPU"):
+        sentiment_integration._get_pipeline(0, "int8")
@@ -86,7 +86,11 @@ def fit_vecm_garch(
 
     # Forecast future values
     forecast = vecm_res.predict(steps=forecast_steps)
-    forecast_index = pd.date_range(start=series.index[-1], periods=forecast_steps + 1, freq=series.index.freq)[1:]
+    last, freq = series.index[-1], series.index.freq
+    if freq is None:
+        # Same daily default that pd.date_range applies when freq is None
+        freq = pd.offsets.Day()
+    forecast_index = pd.date_range(start=last + freq, periods=forecast_steps, freq=freq)
     forecast_df = pd.DataFrame(forecast, index=forecast_index, columns=series.columns)
 
     return VecmGarchResult(vecm_res, forecast_df)